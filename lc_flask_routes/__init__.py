@@ -21,7 +21,7 @@
 ## OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 ## SOFTWARE.
 
-from .route import BaseRouteMixin, RouteResponse, WerkzeugLocalProxy
+from .route import AsyncBaseRouteMixin, BaseRouteMixin, RouteResponse, WerkzeugLocalProxy
 try:
     from .route import BaseRouteWithParserMixin
 except (ImportError, ModuleNotFoundError):
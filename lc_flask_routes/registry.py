@@ -21,6 +21,8 @@
 ## OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 ## SOFTWARE.
 
+import os
+
 try:
     from typing import Any, Callable, Type
 
@@ -22,12 +22,16 @@
 ## SOFTWARE.
 # pylint: disable=W0613
 
+import inspect
 import logging
-import os
-from typing import Any, ClassVar, Dict, Optional, Tuple, Union
+from typing import (Any, Awaitable, Callable, ClassVar, Dict, FrozenSet, List, Optional, Set,
+                    Tuple, Type, Union, cast)
 
 import flask
-from werkzeug.local import LocalProxy as WerkzeugLocalProxy
+from flask import abort, current_app as _current_app, request as _request, session as _session
+from flask.sessions import SessionMixin
+# WerkzeugLocalProxy is re-exported for compatibility (see: __init__.py)
+from werkzeug.local import LocalProxy as WerkzeugLocalProxy    # pylint: disable=unused-import
 from werkzeug.wrappers import Response as WerkzeugResponse
 
 
@@ -38,6 +42,39 @@ logger = logging.getLogger(__name__)    # pylint: disable=invalid-name
 RouteMap = Dict[str, Dict[str, Any]]
 RouteResponseData = Union[WerkzeugResponse, Dict[str, Any], str]
 RouteResponse = Union[Tuple[RouteResponseData, int], RouteResponseData]
+RouteHandler = Callable[..., RouteResponse]
+AsyncRouteHandler = Callable[..., Awaitable[RouteResponse]]
+
+# HTTP methods checked for a handler of the same name (lowercase)
+# on each route class, in addition to any listed in ROUTE_MAP
+_HTTP_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
+# HTTP methods Flask implements automatically, which are kept in "methods"
+# if listed explicitly (see: _restrict_route_methods)
+_AUTOMATIC_METHODS: FrozenSet[str] = frozenset({"HEAD", "OPTIONS"})
+# Default HTTP method handlers defined on mixins, which return 405 response
+# (see: BaseRouteMixin.gen_method_handlers)
+_DEFAULT_HANDLERS: Set[Callable[..., Any]] = set()
+
+
+def _default_handler(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Mark func as default HTTP method handler (see: _DEFAULT_HANDLERS)."""
+    _DEFAULT_HANDLERS.add(func)
+    return func
+
+
+def _call_handler(handler: Callable[..., Any],
+                  wants_context: bool,
+                  request: flask.Request,
+                  route_kwargs: Dict[str, Any]) -> Any:
+    """Call HTTP method handler with route_kwargs, preceded by the current app,
+    request, and session if wants_context is True (see: BaseRouteMixin.WANTS_CONTEXT).
+    """
+    if not wants_context:
+        return handler(route_kwargs)
+    return handler(_current_app._get_current_object(),
+                   request,
+                   _session._get_current_object(),
+                   route_kwargs)
 
 
 class BaseRouteMixin:
@@ -53,6 +90,96 @@ class BaseRouteMixin:
     # key-value pairs map to arguments for the flask.Flask.add_url_rule
     # see: https://flask.palletsprojects.com/en/1.1.x/api/#flask.Flask.add_url_rule
     ROUTE_MAP: ClassVar[Optional[RouteMap]] = None
+    # If False, handlers are called with route_kwargs only, i.e.
+    # get(cls, route_kwargs), rather than with the current app, request, and session
+    WANTS_CONTEXT: ClassVar[bool] = True
+    # HTTP method (uppercase) => bound handler, for each handler implemented by the class
+    # (see: BaseRouteMixin.gen_method_handlers)
+    _METHOD_HANDLERS: ClassVar[Dict[str, RouteHandler]] = dict()
+    # (route, route_options) pairs from ROUTE_MAP, validated on class creation
+    _FROZEN_ROUTES: ClassVar[Tuple[Tuple[str, Dict[str, Any]], ...]] = tuple()
+    # Function that dispatches each request to the handler for its HTTP method,
+    # generated on class creation (see: _gen_view_func)
+    _DISPATCH_FUNC: ClassVar[RouteHandler]
+    # View function registered for each route, either _DISPATCH_FUNC or
+    # overridden handle_request
+    _VIEW_FUNC: ClassVar[Optional[RouteHandler]] = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Validate routes defined in ROUTE_MAP once, rather than
+        # each time the class is registered with an app
+        frozen_routes = list()
+        if cls.ROUTE_MAP:
+            for route, route_options in cls.ROUTE_MAP.items():
+                # Ensure "view_func" key isn't defined in route_options
+                # Would conflict with setting view_func=cls.handle_request
+                if "view_func" in route_options:
+                    logger.warning("Failed to register handler for route %s "
+                                   "(route options cannot contain \"view_func\" key)", route)
+                    continue
+                frozen_routes.append((route, dict(route_options)))
+        cls._FROZEN_ROUTES = tuple(frozen_routes)
+        # Cache handlers for HTTP methods implemented by class
+        cls._METHOD_HANDLERS = cls.gen_method_handlers()
+        # Generate dispatch function with dispatch state bound, used by both
+        # BaseRouteMixin.handle_request and as view function if handle_request
+        # isn't overridden (otherwise use overridden handle_request)
+        cls._DISPATCH_FUNC = _gen_view_func(cls)
+        if _uses_handle_request(cls):
+            cls._VIEW_FUNC = cls._DISPATCH_FUNC
+            cls._FROZEN_ROUTES = _restrict_route_methods(cls)
+        else:
+            cls._VIEW_FUNC = cls.handle_request
+
+    @classmethod
+    def gen_method_handlers(cls) -> Dict[str, RouteHandler]:
+        """
+        Args:
+            N/A
+        Returns:
+            Mapping of HTTP method (uppercase, as in flask.Request.method) to bound
+            handler for each method the class implements. Methods that resolve to one of the default
+            handlers defined on BaseRouteMixin or AsyncBaseRouteMixin (which return 405) are excluded.
+        Preconditions:
+            N/A
+        Raises:
+            N/A
+        """
+        # Collect HTTP methods to check for handlers
+        method_names = set(_HTTP_METHODS)
+        if cls.ROUTE_MAP:
+            for route_options in cls.ROUTE_MAP.values():
+                method_names.update(method.upper() for method in (route_options.get("methods") or ()))
+
+        method_handlers = dict()
+        for method_name in method_names:
+            handler_name = method_name.lower()
+            handler = getattr(cls, handler_name, None)
+            # If class doesn't have handler defined for HTTP method, skip it
+            if not callable(handler):
+                continue
+            # If handler is default defined on BaseRouteMixin (or AsyncBaseRouteMixin), skip it
+            if getattr(handler, "__func__", None) in _DEFAULT_HANDLERS:
+                continue
+            # Store bound handler so no attribute lookup is required per request
+            method_handlers[method_name] = handler
+        return method_handlers
+
+    @classmethod
+    def collect_rules(cls) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Args:
+            N/A
+        Returns:
+            (route, route_options) pairs from cls.ROUTE_MAP that will be registered
+            by register_route, validated when the class is created.
+        Preconditions:
+            N/A
+        Raises:
+            N/A
+        """
+        return list(cls._FROZEN_ROUTES)
 
     @classmethod
     def register_route(cls, app: flask.Flask) -> None:
@@ -62,25 +189,26 @@ class BaseRouteMixin:
         Procedure:
             Register route(s) defined in cls.ROUTE_MAP with provided Flask app.
         Preconditions:
-            N/A
+            cls.ROUTE_MAP is validated when the class is created, and any route
+            with the "view_func" key defined is skipped (logging a WARNING). HTTP method
+            handlers (e.g., cls.get) and cls.WANTS_CONTEXT are also bound when the class is
+            created. Changes to cls.ROUTE_MAP, handlers, or cls.WANTS_CONTEXT after class
+            creation (including mock.patch.object on a handler) are not reflected. Unless handle_request
+            is overridden, "methods" for each route are restricted to those with a handler
+            implemented (see: collect_rules).
         Raises:
             This function does not raise an exception, because the failure to register
             one route should not necessarily preclude registering other routes. Instead,
             it logs a WARNING for each route that fails.
         """
-        # If ROUTE_MAP defined
-        if cls.ROUTE_MAP:
-            # For each route defined in ROUTE_MAP
-            for route, route_options in cls.ROUTE_MAP.items():
-                try:
-                    # Ensure "view_func" key isn't defined in route_options
-                    # Would conflict with setting view_func=cls.handle_request
-                    if "view_func" in route_options:
-                        raise KeyError("route options cannot contain \"view_func\" key")
-                    # Add route with options to app, using cls.handle_request as route handler ("view_func")
-                    app.add_url_rule(route, view_func=cls.handle_request, **route_options)
-                except Exception as exc:
-                    logger.warning("Failed to register handler for route {} ({})".format(route, exc))
+        # For each route defined in ROUTE_MAP
+        for route, route_options in cls._FROZEN_ROUTES:
+            try:
+                # Add route with options to app, using cls._VIEW_FUNC as route handler ("view_func")
+                # (equivalent to cls.handle_request)
+                app.add_url_rule(route, view_func=cls._VIEW_FUNC, **route_options)
+            except Exception as exc:
+                logger.warning("Failed to register handler for route %s (%s)", route, exc)
 
     @classmethod
     def handle_request(cls, **route_kwargs) -> RouteResponse:
@@ -95,415 +223,393 @@ class BaseRouteMixin:
         Raises:
             TODO
         """
-        # Get current app, request, and session
-        app = flask.current_app
-        request = flask.request
-        request_method = request.method.lower()
-        session = flask.session
-
-        # If class doesn't have handler defined for HTTP method, return 405 response
-        # This protects against a situation where an HTTP method is enabled in cls.ROUTE_MAP
-        # but no associated handler is implemented.
-        # see: https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/405
-        if not hasattr(cls, request_method):
-            flask.abort(405)
-
-        # Trigger handler for method
-        return getattr(cls, request_method)(app, request, session, route_kwargs)
+        # Dispatch to handler for request's HTTP method (see: _gen_view_func)
+        # NOTE: this is the same function registered as view function, so calling
+        # handle_request directly behaves the same as a request to a registered route
+        return cls._DISPATCH_FUNC(**route_kwargs)
 
     @classmethod
+    @_default_handler
     def get(cls,
-            app: WerkzeugLocalProxy,
-            request: WerkzeugLocalProxy,
-            session: WerkzeugLocalProxy,
+            app: flask.Flask,
+            request: flask.Request,
+            session: SessionMixin,
             route_kwargs: Dict[str, Any]) -> RouteResponse:
         """Handle GET requests to route(s)."""
-        flask.abort(405)
+        abort(405)
 
     @classmethod
+    @_default_handler
     def post(cls,
-             app: WerkzeugLocalProxy,
-             request: WerkzeugLocalProxy,
-             session: WerkzeugLocalProxy,
+             app: flask.Flask,
+             request: flask.Request,
+             session: SessionMixin,
              route_kwargs: Dict[str, Any]) -> RouteResponse:
         """Handle POST requests to route(s)."""
-        flask.abort(405)
+        abort(405)
 
     @classmethod
+    @_default_handler
     def put(cls,
-            app: WerkzeugLocalProxy,
-            request: WerkzeugLocalProxy,
-            session: WerkzeugLocalProxy,
+            app: flask.Flask,
+            request: flask.Request,
+            session: SessionMixin,
             route_kwargs: Dict[str, Any]) -> RouteResponse:
         """Handle PUT requests to route(s)."""
-        flask.abort(405)
+        abort(405)
 
     @classmethod
+    @_default_handler
     def delete(cls,
-               app: WerkzeugLocalProxy,
-               request: WerkzeugLocalProxy,
-               session: WerkzeugLocalProxy,
+               app: flask.Flask,
+               request: flask.Request,
+               session: SessionMixin,
                route_kwargs: Dict[str, Any]) -> RouteResponse:
         """Handle DELETE requests to route(s)."""
-        flask.abort(405)
+        abort(405)
 
 
-try:
-    from lc_flask_reqparser import RequestParser
+def _uses_handle_request(cls: Type[BaseRouteMixin]) -> bool:
+    """Whether cls uses the handle_request implementation defined on BaseRouteMixin,
+    meaning it isn't overridden by cls (or one of its parent classes).
+    """
+    return getattr(cls.handle_request, "__func__", None) is BaseRouteMixin.__dict__["handle_request"].__func__
 
 
-    class BaseRouteWithParserMixin(BaseRouteMixin):
-        """Like `BaseRouteMixin`, but supports defining a
-        `RequestParser` to parse GET, POST, or PUT parameters.
+def _restrict_route_methods(cls: Type[BaseRouteMixin]) -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+    """Restrict "methods" defined for each route in cls._FROZEN_ROUTES to those
+    with a handler implemented by cls, so Werkzeug responds to any other method
+    with 405 ("Method Not Allowed") while matching the request, without calling
+    the view function. Routes without "methods" defined, or with "methods" that
+    isn't a list, tuple, or set (which Flask rejects on registration), are left unchanged.
+    Explicitly listed HEAD and OPTIONS are kept, because removing them would enable
+    Flask's automatic handling for those methods (see: _AUTOMATIC_METHODS).
+    """
+    restricted_routes = list()
+    for route, route_options in cls._FROZEN_ROUTES:
+        methods = route_options.get("methods")
+        if methods and isinstance(methods, (list, tuple, set)):
+            route_options = dict(route_options,
+                                 methods=[method for method in methods
+                                          if (method.upper() in cls._METHOD_HANDLERS or
+                                              method.upper() in _AUTOMATIC_METHODS)])
+        restricted_routes.append((route, route_options))
+    return tuple(restricted_routes)
+
+
+def _gen_view_func(cls: Type[BaseRouteMixin]) -> RouteHandler:
+    """Generate function that dispatches each request to the handler for its
+    HTTP method (see: BaseRouteMixin._DISPATCH_FUNC), with the method handlers and
+    WANTS_CONTEXT for cls bound in the closure rather than looked up on each request.
+    """
+    method_handlers = cls._METHOD_HANDLERS
+    wants_context = cls.WANTS_CONTEXT
+
+    # If class implements a single handler (the common case), compare
+    # request method directly rather than looking up handler
+    # NOTE: Werkzeug generates request.method with str.upper on each request, so it's never
+    # identical to an interned constant, and interning it per request is slower than
+    # comparing by equality (or looking it up in method_handlers)
+    if len(method_handlers) == 1:
+        (handler_method, single_handler), = method_handlers.items()
+
+        def handle_single_request(**route_kwargs) -> RouteResponse:
+            request = _request._get_current_object()
+            if request.method != handler_method:
+                abort(405)
+            return _call_handler(single_handler, wants_context, request, route_kwargs)
+
+        # Preserve name, which Flask uses as default endpoint
+        handle_single_request.__name__ = "handle_request"
+        return handle_single_request
+
+    def handle_request(**route_kwargs) -> RouteResponse:
+        # Get current request
+        # Resolve proxied objects once, so handlers don't pay for proxy
+        # lookup on each attribute access
+        request = _request._get_current_object()
+        # If class doesn't have handler defined for HTTP method, return 405 response
+        # This protects against a situation where an HTTP method is enabled in cls.ROUTE_MAP
+        # but no associated handler is implemented.
+        # see: https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/405
+        # NOTE: Werkzeug always uppercases request.method
+        handler = method_handlers.get(request.method)
+        if handler is None:
+            return abort(405)
+        return _call_handler(handler, wants_context, request, route_kwargs)
+
+    return handle_request
+
+
+class AsyncBaseRouteMixin(BaseRouteMixin):
+    """Like `BaseRouteMixin`, but HTTP method handlers are coroutines
+    (`async def` classmethods), and are awaited by `handle_request`.
+    Requires Flask >= 2.0 installed with the `async` extra, which runs
+    each async view in an event loop on the worker thread. This only
+    improves throughput for handlers that await I/O (outbound HTTP
+    requests, database queries, etc.), and adds overhead otherwise.
+    """
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Ensure each handler is a coroutine function, because handle_request
+        # awaits it and would fail on each request otherwise
+        for method_name, handler in tuple(cls._METHOD_HANDLERS.items()):
+            if not inspect.iscoroutinefunction(handler):
+                logger.warning("Ignoring %s handler for route class %s "
+                               "(handler must be defined with \"async def\")", method_name, cls.__name__)
+                del cls._METHOD_HANDLERS[method_name]
+
+    @classmethod
+    def register_route(cls, app: flask.Flask) -> None:
+        """Like BaseRouteMixin.register_route, but logs a WARNING and doesn't
+        register route(s) if app can't run async views (Flask < 2.0).
         """
-        __slots__ = ()
+        # Flask < 2.0 doesn't define Flask.ensure_sync, and would return
+        # the coroutine from handle_request as the response
+        if not hasattr(app, "ensure_sync"):
+            logger.warning("Failed to register handler for route class %s "
+                           "(async views require Flask >= 2.0)", cls.__name__)
+            return
+        super().register_route(app)
 
-        @classmethod
-        def gen_request_parser(cls) -> Optional[RequestParser]:
-            """
-            Args:
-                N/A
-            Returns:
-                Parser for URL parameters (GET) or request body (POST/PUT). Default
-                implementation returns None.
-            Preconditions:
-                N/A
-            Raises:
-                N/A
-            """
-            return None
+    @classmethod
+    async def handle_request(cls,     # type: ignore  # pylint: disable=invalid-overridden-method
+                             **route_kwargs) -> RouteResponse:
+        """Like BaseRouteMixin.handle_request, but awaits handler."""
+        # Get current request
+        request = _request._get_current_object()
 
-        @classmethod
-        def handle_request(cls, **route_kwargs) -> RouteResponse:
-            # Get current request and HTTP method
-            request = flask.request
-            request_method = request.method
+        # If class doesn't have handler defined for HTTP method, return 405 response
+        # (see: BaseRouteMixin.handle_request)
+        # NOTE: handlers are coroutines, so cast from RouteHandler
+        handler = cast(Optional[AsyncRouteHandler], cls._METHOD_HANDLERS.get(request.method))
+        if handler is None:
+            return abort(405)
 
-            # Generate request parser
-            parser = cls.gen_request_parser()
-            # If request parser defined and HTTP method is GET, POST, or PUT
-            if parser and request_method in {"GET", "POST", "PUT"}:
-                try:
-                    # Try to parse known request arguments
-                    args, _ = parser.parse_args()
-                except TypeError:
-                    # Indicates invalid mimetype for POST/PUT request
-                    # return 415 response ("Unsupported Media Type")
-                    # see: https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/415
-                    flask.abort(415)
-                except RuntimeError as exc:
-                    # If error message indicates failed to parse
-                    # request arguments, return 400 response ("Bad Request")
-                    # see: RequestParser.error
-                    if (exc.args and
-                        isinstance(exc.args[0], str) and
-                        exc.args[0].startswith("Failed to parse provided arguments")):
-                        flask.abort(400)
-                    # Otherwise, indicates outside of request context
-                    # and should raise original exception
-                    else:
-                        raise
-
-                # Merge parsed request arguments with route_kwargs
-                # NOTE: request arguments will override route variable rules
-                route_kwargs.update(dict(args._get_kwargs()))
-
-            # Trigger handler from BaseRouteMixin with updated route_kwargs
-            return super().handle_request(**route_kwargs)
+        # Trigger handler for method
+        return await _call_handler(handler, cls.WANTS_CONTEXT, request, route_kwargs)
 
-except (ImportError, ModuleNotFoundError):
-    pass
+    @classmethod
+    @_default_handler
+    async def get(cls,     # type: ignore  # pylint: disable=invalid-overridden-method
+                  app: flask.Flask,
+                  request: flask.Request,
+                  session: SessionMixin,
+                  route_kwargs: Dict[str, Any]) -> RouteResponse:
+        """Handle GET requests to route(s)."""
+        abort(405)
+
+    @classmethod
+    @_default_handler
+    async def post(cls,    # type: ignore  # pylint: disable=invalid-overridden-method
+                   app: flask.Flask,
+                   request: flask.Request,
+                   session: SessionMixin,
+                   route_kwargs: Dict[str, Any]) -> RouteResponse:
+        """Handle POST requests to route(s)."""
+        abort(405)
 
+    @classmethod
+    @_default_handler
+    async def put(cls,     # type: ignore  # pylint: disable=invalid-overridden-method
+                  app: flask.Flask,
+                  request: flask.Request,
+                  session: SessionMixin,
+                  route_kwargs: Dict[str, Any]) -> RouteResponse:
+        """Handle PUT requests to route(s)."""
+        abort(405)
 
-if os.environ.get("ENVIRONMENT") == "TEST":
-    import unittest
+    @classmethod
+    @_default_handler
+    async def delete(cls,  # type: ignore  # pylint: disable=invalid-overridden-method
+                     app: flask.Flask,
+                     request: flask.Request,
+                     session: SessionMixin,
+                     route_kwargs: Dict[str, Any]) -> RouteResponse:
+        """Handle DELETE requests to route(s)."""
+        abort(405)
 
 
-    def gen_flask_app():
-        """Generate test Flask app."""
-        return flask.Flask(__name__)
+try:
+    from lc_flask_reqparser import RequestParser
+    try:
+        from lc_flask_reqparser import ParseArgumentsError as _ParseArgumentsError
+    except (ImportError, ModuleNotFoundError):
+        class _ParseArgumentsError(RuntimeError):     # type: ignore
+            """Placeholder for versions of lc_flask_reqparser that raise
+            RuntimeError on parse failure (see: RequestParser.error).
+            """
 
 
-    class BaseRoute(BaseRouteMixin):
-        """Base route class."""
-        __slots__ = ()
+    # HTTP methods with arguments parsed by request parser
+    _PARSER_METHODS: FrozenSet[str] = frozenset({"GET", "POST", "PUT"})
+    # Sentinel for request parser not yet generated
+    # (gen_request_parser may return None)
+    _UNSET = object()
 
 
-    class IndexRoute(BaseRoute):
-        """Route: /
-        Endpoint: "index"
-        Description: Splash page
+    def _gen_parse_args_func(parser: RequestParser) -> Callable[[], Dict[str, Any]]:
+        """Generate function that parses known arguments from current request
+        with parser, and returns them as dict.
         """
-        __slots__ = ()
+        # If parser can return parsed arguments as dict, use it directly
+        # rather than generating Namespace
+        parse_args_dict = getattr(parser, "parse_args_dict", None)
+        if parse_args_dict is not None:
+            return parse_args_dict
 
-        ROUTE_MAP = {
-            "/": {"endpoint": "index_root", "methods": ["GET"]},
-            "/index": {"endpoint": "index_index", "methods": ["GET", "PATCH"]},
-        }
+        def parse_args() -> Dict[str, Any]:
+            args, _ = parser.parse_args()
+            return vars(args)
 
-        @classmethod
-        def get(cls,
-                app: WerkzeugLocalProxy,
-                request: WerkzeugLocalProxy,
-                session: WerkzeugLocalProxy,
-                route_kwargs: Dict[str, Any]) -> RouteResponse:
-            return "<h1>Splash Page</h1>", 200
-
-
-    class InvalidRoute(BaseRoute):
-        """Route: /invalid
-        Endpoint: "invalid"
-        Description: Route with invalid ROUTE_MAP ("view_func")
-        """
-        __slots__ = ()
+        return parse_args
 
-        ROUTE_MAP = {"/invalid": {
-            "endpoint": "invalid",
-            "methods": ["GET", "POST"],
-            "view_func": lambda **kwargs: "<h1>Invalid route</h1>",
-        }}
 
+    def _parse_request_args(parse_args: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Parse known arguments from current request with parse_args (see: _gen_parse_args_func),
+        aborting with 415 ("Unsupported Media Type") or 400 ("Bad Request") response on failure.
+        """
+        try:
+            # Try to parse known request arguments
+            parsed_args = parse_args()
+        except TypeError:
+            # Indicates invalid mimetype for POST/PUT request
+            # return 415 response ("Unsupported Media Type")
+            # see: https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/415
+            abort(415)
+        except _ParseArgumentsError:
+            # Indicates failed to parse request arguments,
+            # return 400 response ("Bad Request")
+            abort(400)
+        except RuntimeError as exc:
+            # If error message indicates failed to parse
+            # request arguments, return 400 response ("Bad Request")
+            # NOTE: only for versions of lc_flask_reqparser without ParseArgumentsError
+            # see: RequestParser.error
+            if (exc.args and
+                isinstance(exc.args[0], str) and
+                exc.args[0].startswith("Failed to parse provided arguments")):
+                abort(400)
+            # Otherwise, indicates outside of request context
+            # and should raise original exception
+            else:
+                raise
+        return parsed_args
 
-    class TestBaseRouteMixin(unittest.TestCase):
-        """Tests for BaseRouteMixin."""
 
-        def test_register_routes_url_map(self):
-            """Test BaseRouteMixin.register_route to ensure each defined route
-            gets registered with correct endpoint, rule (URI), and methods.
-            """
-            # Create Flask app
-            app = gen_flask_app()
-
-            # Register IndexRoute with app
-            IndexRoute.register_route(app)
-            # Ensure that "index" endpoint has rules "/" and "/index"
-            # with proper methods (at least "GET")
-            # NOTE: Flask will automatically implement OPTIONS and HEAD
-            for route, route_options in IndexRoute.ROUTE_MAP.items():
-                endpoint = route_options.get("endpoint")
-                rule_list = app.url_map._rules_by_endpoint.get(endpoint)
-                self.assertTrue((bool(rule_list) and
-                                rule_list[0].rule == route and
-                                "GET" in rule_list[0].methods))
-
-        def test_register_routes_view_func_in_options(self):
-            """Test that any ROUTE_MAP with the "view_func" key
-            defined raises KeyError on route registration.
-            """
-            # Create Flask app
-            app = gen_flask_app()
+    class BaseRouteWithParserMixin(BaseRouteMixin):
+        """Like `BaseRouteMixin`, but supports defining a
+        `RequestParser` to parse GET, POST, or PUT parameters.
+        """
+        __slots__ = ()
 
-            # Attempt to register InvalidRoute, which should log WARNING
-            # see: https://docs.python.org/3/library/unittest.html#unittest.TestCase.assertLogs
-            with self.assertLogs(logger=__name__, level=logging.WARNING):
-                InvalidRoute.register_route(app)
+        # Whether parser returned by gen_request_parser can be reused
+        # across requests. Set to False if parser holds request-specific state,
+        # and a new parser will be generated for each request.
+        PARSER_IS_REUSABLE: ClassVar[bool] = True
+        # Parser generated by gen_request_parser, cached on first call
+        # to get_request_parser (see: get_request_parser)
+        _CACHED_PARSER: ClassVar[Any] = _UNSET
+        # Whether gen_request_parser is overridden, set on class creation
+        _HAS_PARSER: ClassVar[bool] = False
+
+        def __init_subclass__(cls, **kwargs) -> None:
+            super().__init_subclass__(**kwargs)
+            # Check whether gen_request_parser is overridden rather than calling it,
+            # so parser isn't generated on class creation (where it may fail or depend on
+            # app context), and routes without a parser can skip the parsing step entirely
+            cls._HAS_PARSER = (getattr(cls.gen_request_parser, "__func__", None) is not
+                               BaseRouteWithParserMixin.__dict__["gen_request_parser"].__func__)
+            # If parser is defined, generate dispatch function with parser
+            # bound as well (see: BaseRouteMixin.__init_subclass__)
+            if cls._HAS_PARSER:
+                cls._DISPATCH_FUNC = _gen_parser_view_func(cls)
+                if _uses_handle_request(cls):
+                    cls._VIEW_FUNC = cls._DISPATCH_FUNC
 
-        def test_handle_request_method_not_implemented(self):
-            """Test that HTTP 405 status code is returned if HTTP
-            method supported in ROUTE_MAP but not implemented on route class.
+        @classmethod
+        def gen_request_parser(cls) -> Optional[RequestParser]:
             """
-            # Create Flask app
-            app = gen_flask_app()
-
-            # Register IndexRoute with app
-            IndexRoute.register_route(app)
-            # Send PATCH request to index route "/" and ensure
-            # HTTP 405 status code returned
-            with app.test_client() as client:
-                response = client.patch("/")
-                self.assertEqual(405, response.status_code)
-
-        def test_handle_request_proper_method(self):
-            """Test that handle_request triggers correct handler
-            based on request method.
+            Args:
+                N/A
+            Returns:
+                Parser for URL parameters (GET) or request body (POST/PUT). Default
+                implementation returns None.
+            Preconditions:
+                Not called when the class is created, so may depend on app context or
+                environment. If cls.PARSER_IS_REUSABLE is True (default), called on the first
+                request to the route and cached on the class, so the same parser is used for
+                every app the class is registered with. If the parser depends on the current
+                app (e.g., reads flask.current_app.config) and the class is registered with
+                multiple apps, set cls.PARSER_IS_REUSABLE to False.
+            Raises:
+                N/A
             """
-            # Create Flask app
-            app = gen_flask_app()
-
-            # Register IndexRoute with app
-            IndexRoute.register_route(app)
-            # Ensure response status code was 200 and
-            # HTML matches `IndexRoute.get` HTML response
-            with app.test_client() as client:
-                response = client.get("/")
-                self.assertEqual(200, response.status_code)
-                self.assertEqual(b"<h1>Splash Page</h1>", response.data)
-
+            return None
 
-    try:
-        class NoParserNoVRRoute(BaseRouteWithParserMixin):
-            """Route: /
-            Endpoint: "index"
-            Description: Splash Page
+        @classmethod
+        def get_request_parser(cls) -> Optional[RequestParser]:
             """
-            __slots__ = ()
-
-            ROUTE_MAP = {"/": {"endpoint": "index", "methods": ["GET"]}}
-
-            @classmethod
-            def get(cls,
-                    app: WerkzeugLocalProxy,
-                    request: WerkzeugLocalProxy,
-                    session: WerkzeugLocalProxy,
-                    route_kwargs: Dict[str, Any]) -> RouteResponse:
-                return route_kwargs, 200
-
-
-        class NoParserWithVRRoute(NoParserNoVRRoute):
-            __slots__ = ()
-
-            ROUTE_MAP = {"/person/<full_name>": {"endpoint": "search_person", "methods": ["GET"]}}
-
-
-        class WithParserNoVRRoute(NoParserNoVRRoute):
-            __slots__ = ()
-
-            ROUTE_MAP = {"/location": {"endpoint": "search_location", "methods": ["GET", "DELETE", "POST"]}}
-
-            @classmethod
-            def gen_request_parser(cls) -> Optional[RequestParser]:
-                return (RequestParser()
-                        .add_argument("name", required=True)
-                        .add_argument("age", type=int, required=True))
-
-            @classmethod
-            def post(cls,
-                     app: WerkzeugLocalProxy,
-                     request: WerkzeugLocalProxy,
-                     session: WerkzeugLocalProxy,
-                     route_kwargs: Dict[str, Any]) -> RouteResponse:
-                return route_kwargs, 200
-
-            @classmethod
-            def delete(cls,
-                       app: WerkzeugLocalProxy,
-                       request: WerkzeugLocalProxy,
-                       session: WerkzeugLocalProxy,
-                       route_kwargs: Dict[str, Any]) -> RouteResponse:
-                return route_kwargs, 200
-
-
-        class WithParserWithVRRoute(NoParserNoVRRoute):
-            __slots__ = ()
-
-            ROUTE_MAP = {"/team/<team_name>": {"endpoint": "search_location", "methods": ["GET"]}}
-
-            @classmethod
-            def gen_request_parser(cls) -> Optional[RequestParser]:
-                return (RequestParser()
-                        .add_argument("team_name")
-                        .add_argument("alias"))
-
-
-        class TestBaseRouteWithParserMixin(unittest.TestCase):
-            """Tests for BaseRouteWithParserMixin."""
-
-            def test_handle_request_no_parser_no_route_kwargs(self):
-                """Test that if no parser and no route variable rules
-                defined, route_kwargs passed to handler are empty.
-                """
-                # Create Flask app
-                app = gen_flask_app()
-
-                # Register NoParserNoVRRoute with app
-                NoParserNoVRRoute.register_route(app)
-                # Ensure JSON response is empty
-                with app.test_client() as client:
-                    response = client.get("/")
-                    self.assertEqual(dict(), response.get_json(cache=False))
-
-            def test_handle_request_no_parser_route_kwargs(self):
-                """Test that if no parser defined but do have route
-                variable rules, route_kwargs only contains variable rule
-                values.
-                """
-                # Create Flask app
-                app = gen_flask_app()
-
-                # Register NoParserWithVRRoute with app
-                NoParserWithVRRoute.register_route(app)
-                # Ensure response only contains "full_name" kwarg
-                with app.test_client() as client:
-                    response = client.get("/person/peter%20johnson")
-                    self.assertEqual(dict(full_name="peter johnson"), response.get_json(cache=False))
-
-            def test_handle_request_with_parser_wrong_method(self):
-                """Test that if parser defined but HTTP method isn't
-                GET, POST, or PUT, route_kwargs doesn't contain any parameters
-                sent with request.
-                """
-                # Create Flask app
-                app = gen_flask_app()
-
-                # Register WithParserNoVRRoute with app
-                WithParserNoVRRoute.register_route(app)
-                # Ensure response is empty
-                with app.test_client() as client:
-                    response = client.delete("/location?name=Sports%20Arena&age=5")
-                    self.assertEqual(dict(), response.get_json(cache=False))
-
-            def test_handle_request_with_parser_invalid_mimetype(self):
-                """Test that if parser defined and HTTP method is POST,
-                but mimetype isn't JSON, response is 400.
-                """
-                # Create Flask app
-                app = gen_flask_app()
-
-                # Register WithParserNoVRRoute with app
-                WithParserNoVRRoute.register_route(app)
-                # Ensure response code is 400
-                with app.test_client() as client:
-                    response = client.post("/location",
-                                           data="<element><child>Hello World</child></element>",
-                                           mimetype="text/xml")
-                    self.assertEqual(400, response.status_code)
-
-            def test_handle_request_with_parser_invalid_argument(self):
-                """Test that if parser defined and argument invalid (parser
-                fails to parser arguments), response is 400.
-                """
-                # Create Flask app
-                app = gen_flask_app()
-
-                # Register WithParserNoVRRoute with app
-                WithParserNoVRRoute.register_route(app)
-                # Ensure response code is 400
-                with app.test_client() as client:
-                    response = client.post("/location",
-                                           json=dict(name="Sports Arena", age="invalid"))
-                    self.assertEqual(400, response.status_code)
-
-            def test_handle_request_with_parser_merge_arguments(self):
-                """Test that if parser defined and arguments are valid, but
-                no route variable rules defined, route_kwargs only contain
-                parser arguments.
-                """
-                # Create Flask app
-                app = gen_flask_app()
-
-                # Register WithParserNoVRRoute with app
-                WithParserNoVRRoute.register_route(app)
-                # Ensure response JSON matches request
-                with app.test_client() as client:
-                    response = client.post("/location",
-                                           json=dict(name="Sports Arena", age="10"))
-                    self.assertEqual(dict(name="Sports Arena", age=10), response.get_json())
-
-            def test_handle_request_with_parser_merge_arguments_vrules(self):
-                """Test that if parser defined and arguments are valid, and
-                route variable rules defined, route_kwargs contains
-                parser arguments where parsed argument(s) overwrite variable rules.
-                """
-                # Create Flask app
-                app = gen_flask_app()
-
-                # Register WithParserWithVRRoute with app
-                WithParserWithVRRoute.register_route(app)
-                # Ensure response contains "team_name" from URL parameter,
-                # not route variable rule
-                with app.test_client() as client:
-                    response = client.get("/team/FC%20Barcelona?team_name=FC%20Milan")
-                    self.assertEqual(dict(team_name="FC Milan", alias=None), response.get_json())
+            Args:
+                N/A
+            Returns:
+                Parser from gen_request_parser, generated once and cached on the class
+                if cls.PARSER_IS_REUSABLE is True (default), otherwise generated on each call.
+            Preconditions:
+                N/A
+            Raises:
+                N/A
+            """
+            # If parser can't be reused, generate new parser
+            if not cls.PARSER_IS_REUSABLE:
+                return cls.gen_request_parser()
+            # Check class __dict__ rather than attribute, so a parser
+            # cached on a parent class isn't used
+            parser = cls.__dict__.get("_CACHED_PARSER", _UNSET)
+            if parser is _UNSET:
+                parser = cls.gen_request_parser()
+                cls._CACHED_PARSER = parser
+            return parser
+
+
+    def _gen_parser_view_func(cls: Type[BaseRouteWithParserMixin]) -> RouteHandler:
+        """Like _gen_view_func, but merges request arguments parsed with the request
+        parser for cls into route_kwargs (for GET, POST, and PUT requests) before calling
+        handler. If the parser is reusable, its parse function is bound in the closure
+        on the first request.
+        """
+        # Parse function resolved on first request if parser is reusable,
+        # rather than on each request (see: _gen_parse_args_func)
+        parse_args: Optional[Callable[[], Dict[str, Any]]] = None
+        parser_is_reusable = cls.PARSER_IS_REUSABLE
+        get_request_parser = cls.get_request_parser
+        method_handlers = cls._METHOD_HANDLERS
+        wants_context = cls.WANTS_CONTEXT
+
+        def handle_request(**route_kwargs) -> RouteResponse:
+            nonlocal parse_args
+            request = _request._get_current_object()
+            request_method = request.method
+            # Merge parsed request arguments with route_kwargs
+            # NOTE: request arguments will override route variable rules
+            if request_method in _PARSER_METHODS:
+                request_parse_args = parse_args
+                if request_parse_args is None:
+                    request_parser = get_request_parser()
+                    if request_parser:
+                        request_parse_args = _gen_parse_args_func(request_parser)
+                        if parser_is_reusable:
+                            parse_args = request_parse_args
+                if request_parse_args is not None:
+                    route_kwargs.update(_parse_request_args(request_parse_args))
+            handler = method_handlers.get(request_method)
+            if handler is None:
+                return abort(405)
+            return _call_handler(handler, wants_context, request, route_kwargs)
+
+        return handle_request
 
-    except (ImportError, ModuleNotFoundError):
-        pass
+except (ImportError, ModuleNotFoundError):
+    pass
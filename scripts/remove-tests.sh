@@ -38,6 +38,9 @@ else
 fi
 
 echo "::: INFO: Removing tests from ${@}"
-find "${@}" -type f -exec $COMMAND -i'' -n "/${PATTERN}/q;p" {} \; \
+# NOTE: only files containing PATTERN are modified, otherwise
+# the last two lines of the file would be removed
+find "${@}" -type f -exec grep -qF "${PATTERN}" {} \; \
+    -exec $COMMAND -i'' -n "/${PATTERN}/q;p" {} \; \
     -exec $COMMAND -i'' '$d' {} \; \
     -exec $COMMAND -i'' '$d' {} \;
@@ -49,6 +49,7 @@ setuptools.setup(
     extras_require={
         "reqparser": ["lc-flask-reqparser"],
         "registry": ["lc-registry"],
+        "async": ["Flask[async]>=2.0"],
         "all": ["lc-flask-reqparser", "lc-registry"],
     },
     classifiers=[
@@ -0,0 +1,831 @@
+## -*- coding: UTF-8 -*-
+## test_route.py
+##
+## Copyright (c) 2020 libcommon
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this software and associated documentation files (the "Software"), to deal
+## in the Software without restriction, including without limitation the rights
+## to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+## copies of the Software, and to permit persons to whom the Software is
+## furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in all
+## copies or substantial portions of the Software.
+##
+## THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+## OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+## SOFTWARE.
+# pylint: disable=W0613
+
+import asyncio
+import importlib.util
+import logging
+from typing import Any, Dict, Optional
+import unittest
+
+import flask
+from flask.sessions import SessionMixin
+from werkzeug.exceptions import MethodNotAllowed
+
+from lc_flask_routes.route import AsyncBaseRouteMixin, BaseRouteMixin, RouteResponse
+try:
+    from lc_flask_routes.route import BaseRouteWithParserMixin, _ParseArgumentsError
+    from lc_flask_reqparser import RequestParser
+    HAS_REQPARSER = True
+except (ImportError, ModuleNotFoundError):
+    HAS_REQPARSER = False
+
+
+def gen_flask_app():
+    """Generate test Flask app."""
+    return flask.Flask(__name__)
+
+
+class BaseRoute(BaseRouteMixin):
+    """Base route class."""
+    __slots__ = ()
+
+
+class IndexRoute(BaseRoute):
+    """Route: /
+    Endpoint: "index"
+    Description: Splash page
+    """
+    __slots__ = ()
+
+    ROUTE_MAP = {
+        "/": {"endpoint": "index_root", "methods": ["GET"]},
+        "/index": {"endpoint": "index_index", "methods": ["GET", "PATCH"]},
+    }
+
+    @classmethod
+    def get(cls,
+            app: flask.Flask,
+            request: flask.Request,
+            session: SessionMixin,
+            route_kwargs: Dict[str, Any]) -> RouteResponse:
+        return "<h1>Splash Page</h1>", 200
+
+
+class TestBaseRouteMixin(unittest.TestCase):
+    """Tests for BaseRouteMixin."""
+
+    def test_register_routes_url_map(self):
+        """Test BaseRouteMixin.register_route to ensure each defined route
+        gets registered with correct endpoint, rule (URI), and methods.
+        """
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Register IndexRoute with app
+        IndexRoute.register_route(app)
+        # Ensure that "index" endpoint has rules "/" and "/index"
+        # with proper methods (at least "GET")
+        # NOTE: Flask will automatically implement OPTIONS and HEAD
+        for route, route_options in IndexRoute.ROUTE_MAP.items():
+            endpoint = route_options.get("endpoint")
+            rule_list = app.url_map._rules_by_endpoint.get(endpoint)
+            self.assertTrue((bool(rule_list) and
+                            rule_list[0].rule == route and
+                            "GET" in rule_list[0].methods))
+
+    def test_collect_rules(self):
+        """Test that BaseRouteMixin.collect_rules returns each
+        route defined in ROUTE_MAP with its options, restricted to
+        methods with a handler implemented.
+        """
+        self.assertEqual([("/", {"endpoint": "index_root", "methods": ["GET"]}),
+                          ("/index", {"endpoint": "index_index", "methods": ["GET"]})],
+                         IndexRoute.collect_rules())
+
+    def test_collect_rules_handle_request_overridden(self):
+        """Test that if handle_request is overridden on route class,
+        methods defined in ROUTE_MAP are left unchanged.
+        """
+        class OverrideRoute(IndexRoute):
+            __slots__ = ()
+
+            @classmethod
+            def handle_request(cls, **route_kwargs) -> RouteResponse:
+                return "<h1>Override</h1>", 200
+
+        self.assertEqual(list(IndexRoute.ROUTE_MAP.items()), OverrideRoute.collect_rules())
+
+    def test_register_routes_view_func_in_options(self):
+        """Test that any ROUTE_MAP with the "view_func" key
+        defined logs WARNING on class creation, and route
+        is not registered.
+        """
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Define InvalidRoute, which should log WARNING
+        # see: https://docs.python.org/3/library/unittest.html#unittest.TestCase.assertLogs
+        with self.assertLogs(logger="lc_flask_routes.route", level=logging.WARNING):
+            class InvalidRoute(BaseRoute):
+                """Route: /invalid
+                Endpoint: "invalid"
+                Description: Route with invalid ROUTE_MAP ("view_func")
+                """
+                __slots__ = ()
+
+                ROUTE_MAP = {"/invalid": {
+                    "endpoint": "invalid",
+                    "methods": ["GET", "POST"],
+                    "view_func": lambda **kwargs: "<h1>Invalid route</h1>",
+                }}
+
+        # Register InvalidRoute with app and ensure
+        # "invalid" endpoint wasn't registered
+        self.assertEqual(list(), InvalidRoute.collect_rules())
+        InvalidRoute.register_route(app)
+        self.assertNotIn("invalid", app.url_map._rules_by_endpoint)
+
+    def test_register_routes_methods_str(self):
+        """Test that if "methods" is a str in ROUTE_MAP, it isn't
+        restricted, and registering route logs WARNING (Flask rejects it).
+        """
+        class StrMethodsRoute(IndexRoute):
+            __slots__ = ()
+
+            ROUTE_MAP = {"/str": {"endpoint": "str_methods", "methods": "GET"}}
+
+        # Ensure methods are left unchanged
+        self.assertEqual([("/str", {"endpoint": "str_methods", "methods": "GET"})],
+                         StrMethodsRoute.collect_rules())
+
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Register StrMethodsRoute with app, and ensure WARNING is logged
+        # and "str_methods" endpoint wasn't registered
+        with self.assertLogs(logger="lc_flask_routes.route", level=logging.WARNING):
+            StrMethodsRoute.register_route(app)
+        self.assertNotIn("str_methods", app.url_map._rules_by_endpoint)
+
+    def test_handle_request_options_listed_not_implemented(self):
+        """Test that if OPTIONS is listed in ROUTE_MAP but not implemented on
+        route class, it is kept (disabling Flask's automatic OPTIONS response)
+        and HTTP 405 status code is returned.
+        """
+        class OptionsRoute(IndexRoute):
+            __slots__ = ()
+
+            ROUTE_MAP = {"/options": {"endpoint": "options", "methods": ["GET", "OPTIONS", "PUT"]}}
+
+        # Ensure OPTIONS is kept and PUT is removed
+        self.assertEqual([("/options", {"endpoint": "options", "methods": ["GET", "OPTIONS"]})],
+                         OptionsRoute.collect_rules())
+
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Register OptionsRoute with app
+        OptionsRoute.register_route(app)
+        # Send OPTIONS request to "/options" and ensure
+        # HTTP 405 status code returned
+        with app.test_client() as client:
+            response = client.options("/options")
+            self.assertEqual(405, response.status_code)
+
+    def test_handle_request_method_not_implemented(self):
+        """Test that HTTP 405 status code is returned if HTTP
+        method supported in ROUTE_MAP but not implemented on route class.
+        """
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Register IndexRoute with app
+        IndexRoute.register_route(app)
+        # Send PATCH request to index route "/" and ensure
+        # HTTP 405 status code returned
+        with app.test_client() as client:
+            response = client.patch("/")
+            self.assertEqual(405, response.status_code)
+
+    def test_handle_request_method_enabled_not_implemented(self):
+        """Test that HTTP 405 status code is returned if HTTP
+        method enabled for route in ROUTE_MAP but not implemented on route class.
+        """
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Ensure PATCH handler not cached for IndexRoute
+        self.assertNotIn("PATCH", IndexRoute._METHOD_HANDLERS)
+        # Register IndexRoute with app
+        IndexRoute.register_route(app)
+        # Send PATCH request to index route "/index" and ensure
+        # HTTP 405 status code returned, with allowed methods
+        # from Werkzeug (PATCH not registered)
+        with app.test_client() as client:
+            response = client.patch("/index")
+            self.assertEqual(405, response.status_code)
+            self.assertEqual({"GET", "HEAD", "OPTIONS"},
+                             {method.strip() for method in response.headers["Allow"].split(",")})
+
+    def test_handle_request_proper_method(self):
+        """Test that handle_request triggers correct handler
+        based on request method.
+        """
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Register IndexRoute with app
+        IndexRoute.register_route(app)
+        # Ensure response status code was 200 and
+        # HTML matches `IndexRoute.get` HTML response
+        with app.test_client() as client:
+            response = client.get("/")
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(b"<h1>Splash Page</h1>", response.data)
+
+    def test_handle_request_multiple_methods(self):
+        """Test that handle_request triggers correct handler based on
+        request method for route class with multiple handlers.
+        """
+        class MultiMethodRoute(IndexRoute):
+            __slots__ = ()
+
+            ROUTE_MAP = {"/multi": {"endpoint": "multi", "methods": ["GET", "POST", "PUT"]}}
+
+            @classmethod
+            def post(cls,
+                     app: flask.Flask,
+                     request: flask.Request,
+                     session: SessionMixin,
+                     route_kwargs: Dict[str, Any]) -> RouteResponse:
+                return "<h1>Posted</h1>", 201
+
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Register MultiMethodRoute with app
+        MultiMethodRoute.register_route(app)
+        # Ensure GET and POST trigger respective handlers,
+        # and PUT returns HTTP 405 status code
+        with app.test_client() as client:
+            self.assertEqual(b"<h1>Splash Page</h1>", client.get("/multi").data)
+            self.assertEqual(201, client.post("/multi").status_code)
+            self.assertEqual(405, client.put("/multi").status_code)
+
+    def test_handle_request_direct_call(self):
+        """Test that handle_request can be called directly
+        within a request context.
+        """
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Ensure IndexRoute.handle_request triggers IndexRoute.get
+        with app.test_request_context("/", method="GET"):
+            self.assertEqual(("<h1>Splash Page</h1>", 200), IndexRoute.handle_request())
+
+    def test_register_routes_handle_request_overridden(self):
+        """Test that if handle_request is overridden on route class,
+        override is registered as view function.
+        """
+        class OverrideRoute(IndexRoute):
+            __slots__ = ()
+
+            ROUTE_MAP = {"/override": {"endpoint": "override", "methods": ["GET"]}}
+
+            @classmethod
+            def handle_request(cls, **route_kwargs) -> RouteResponse:
+                return "<h1>Override</h1>", 200
+
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Register OverrideRoute with app
+        OverrideRoute.register_route(app)
+        # Ensure response is from OverrideRoute.handle_request
+        with app.test_client() as client:
+            response = client.get("/override")
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(b"<h1>Override</h1>", response.data)
+
+    def test_handle_request_resolves_proxies(self):
+        """Test that handle_request passes the current app, request,
+        and session to handler, rather than proxies to them.
+        """
+        class ContextRoute(BaseRoute):
+            __slots__ = ()
+
+            ROUTE_MAP = {"/context": {"endpoint": "context", "methods": ["GET"]}}
+
+            @classmethod
+            def get(cls,
+                    app: flask.Flask,
+                    request: flask.Request,
+                    session: SessionMixin,
+                    route_kwargs: Dict[str, Any]) -> RouteResponse:
+                # NOTE: isinstance would also pass for proxies, which proxy __class__
+                # pylint: disable=unidiomatic-typecheck
+                return dict(app=type(app) is flask.Flask,
+                            request=type(request) is flask.Request,
+                            session=isinstance(session, SessionMixin)), 200
+
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Register ContextRoute with app
+        ContextRoute.register_route(app)
+        # Ensure handler received app, request, and session objects
+        with app.test_client() as client:
+            response = client.get("/context")
+            self.assertEqual(dict(app=True, request=True, session=True), response.get_json())
+
+    def test_handle_request_no_context(self):
+        """Test that if WANTS_CONTEXT is False, handler
+        is called with route_kwargs only.
+        """
+        class NoContextRoute(BaseRoute):
+            __slots__ = ()
+
+            ROUTE_MAP = {"/person/<full_name>": {"endpoint": "no_context", "methods": ["GET"]}}
+            WANTS_CONTEXT = False
+
+            @classmethod
+            def get(cls,    # type: ignore    # pylint: disable=arguments-differ
+                    route_kwargs: Dict[str, Any]) -> RouteResponse:
+                return route_kwargs, 200
+
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Register NoContextRoute with app
+        NoContextRoute.register_route(app)
+        # Ensure response only contains "full_name" kwarg
+        with app.test_client() as client:
+            response = client.get("/person/peter%20johnson")
+            self.assertEqual(dict(full_name="peter johnson"), response.get_json())
+
+
+def run_coroutine(coroutine):
+    """Run coroutine to completion in new event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncIndexRoute(AsyncBaseRouteMixin):
+    """Route: /async
+    Endpoint: "async_index"
+    Description: Splash page (async)
+    """
+    __slots__ = ()
+
+    ROUTE_MAP = {"/async": {"endpoint": "async_index", "methods": ["GET", "POST"]}}
+
+    @classmethod
+    async def get(cls,     # type: ignore
+                  app: flask.Flask,
+                  request: flask.Request,
+                  session: SessionMixin,
+                  route_kwargs: Dict[str, Any]) -> RouteResponse:
+        await asyncio.sleep(0)
+        return "<h1>Async Splash Page</h1>", 200
+
+
+class TestAsyncBaseRouteMixin(unittest.TestCase):
+    """Tests for AsyncBaseRouteMixin."""
+
+    def test_gen_method_handlers_excludes_defaults(self):
+        """Test that default async handlers aren't included
+        in method handlers.
+        """
+        self.assertEqual({"GET"}, set(AsyncIndexRoute._METHOD_HANDLERS))
+
+    def test_handle_request_proper_method(self):
+        """Test that handle_request awaits correct handler
+        based on request method.
+        """
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Ensure AsyncIndexRoute.handle_request awaits AsyncIndexRoute.get
+        with app.test_request_context("/async", method="GET"):
+            self.assertEqual(("<h1>Async Splash Page</h1>", 200),
+                             run_coroutine(AsyncIndexRoute.handle_request()))
+
+    def test_handle_request_method_not_implemented(self):
+        """Test that HTTP 405 status code is returned if HTTP
+        method supported in ROUTE_MAP but not implemented on route class.
+        """
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Ensure AsyncIndexRoute.handle_request aborts with 405 for POST request
+        with app.test_request_context("/async", method="POST"):
+            with self.assertRaises(MethodNotAllowed):
+                run_coroutine(AsyncIndexRoute.handle_request())
+
+    def test_gen_method_handlers_sync_handler(self):
+        """Test that sync handler defined on async route class logs
+        WARNING on class creation, and isn't included in method handlers.
+        """
+        # Define SyncHandlerRoute, which should log WARNING
+        with self.assertLogs(logger="lc_flask_routes.route", level=logging.WARNING):
+            class SyncHandlerRoute(AsyncIndexRoute):
+                __slots__ = ()
+
+                @classmethod
+                def post(cls,     # type: ignore  # pylint: disable=invalid-overridden-method
+                         app: flask.Flask,
+                         request: flask.Request,
+                         session: SessionMixin,
+                         route_kwargs: Dict[str, Any]) -> RouteResponse:
+                    return "<h1>Sync</h1>", 200
+
+        self.assertEqual({"GET"}, set(SyncHandlerRoute._METHOD_HANDLERS))
+
+    @unittest.skipIf(hasattr(flask.Flask, "ensure_sync"), "requires Flask < 2.0")
+    def test_register_routes_no_async_support(self):
+        """Test that registering async route with app that can't
+        run async views logs WARNING, and route is not registered.
+        """
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Register AsyncIndexRoute with app and ensure
+        # "async_index" endpoint wasn't registered
+        with self.assertLogs(logger="lc_flask_routes.route", level=logging.WARNING):
+            AsyncIndexRoute.register_route(app)
+        self.assertNotIn("async_index", app.url_map._rules_by_endpoint)
+
+    @unittest.skipUnless(hasattr(flask.Flask, "ensure_sync") and importlib.util.find_spec("asgiref"),
+                         "requires Flask >= 2.0 with async extra")
+    def test_register_routes_async_view(self):
+        """Test that async route registered with app responds
+        to requests.
+        """
+        # Create Flask app
+        app = gen_flask_app()
+
+        # Register AsyncIndexRoute with app
+        AsyncIndexRoute.register_route(app)
+        # Ensure response status code was 200 and
+        # HTML matches `AsyncIndexRoute.get` HTML response
+        with app.test_client() as client:
+            response = client.get("/async")
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(b"<h1>Async Splash Page</h1>", response.data)
+
+
+if HAS_REQPARSER:
+    class NoParserNoVRRoute(BaseRouteWithParserMixin):
+        """Route: /
+        Endpoint: "index"
+        Description: Splash Page
+        """
+        __slots__ = ()
+
+        ROUTE_MAP = {"/": {"endpoint": "index", "methods": ["GET"]}}
+
+        @classmethod
+        def get(cls,
+                app: flask.Flask,
+                request: flask.Request,
+                session: SessionMixin,
+                route_kwargs: Dict[str, Any]) -> RouteResponse:
+            return route_kwargs, 200
+
+
+    class NoParserWithVRRoute(NoParserNoVRRoute):
+        __slots__ = ()
+
+        ROUTE_MAP = {"/person/<full_name>": {"endpoint": "search_person", "methods": ["GET"]}}
+
+
+    class WithParserNoVRRoute(NoParserNoVRRoute):
+        __slots__ = ()
+
+        ROUTE_MAP = {"/location": {"endpoint": "search_location", "methods": ["GET", "DELETE", "POST"]}}
+
+        @classmethod
+        def gen_request_parser(cls) -> Optional[RequestParser]:
+            return (RequestParser()
+                    .add_argument("name", required=True)
+                    .add_argument("age", type=int, required=True))
+
+        @classmethod
+        def post(cls,
+                 app: flask.Flask,
+                 request: flask.Request,
+                 session: SessionMixin,
+                 route_kwargs: Dict[str, Any]) -> RouteResponse:
+            return route_kwargs, 200
+
+        @classmethod
+        def delete(cls,
+                   app: flask.Flask,
+                   request: flask.Request,
+                   session: SessionMixin,
+                   route_kwargs: Dict[str, Any]) -> RouteResponse:
+            return route_kwargs, 200
+
+
+    class WithParserWithVRRoute(NoParserNoVRRoute):
+        __slots__ = ()
+
+        ROUTE_MAP = {"/team/<team_name>": {"endpoint": "search_location", "methods": ["GET"]}}
+
+        @classmethod
+        def gen_request_parser(cls) -> Optional[RequestParser]:
+            return (RequestParser()
+                    .add_argument("team_name")
+                    .add_argument("alias"))
+
+
+    class TestBaseRouteWithParserMixin(unittest.TestCase):
+        """Tests for BaseRouteWithParserMixin."""
+
+        def test_handle_request_no_parser_no_route_kwargs(self):
+            """Test that if no parser and no route variable rules
+            defined, route_kwargs passed to handler are empty.
+            """
+            # Create Flask app
+            app = gen_flask_app()
+
+            # Ensure NoParserNoVRRoute has no parser
+            self.assertFalse(NoParserNoVRRoute._HAS_PARSER)
+            # Register NoParserNoVRRoute with app
+            NoParserNoVRRoute.register_route(app)
+            # Ensure JSON response is empty
+            with app.test_client() as client:
+                response = client.get("/")
+                self.assertEqual(dict(), response.get_json(cache=False))
+
+        def test_handle_request_no_parser_route_kwargs(self):
+            """Test that if no parser defined but do have route
+            variable rules, route_kwargs only contains variable rule
+            values.
+            """
+            # Create Flask app
+            app = gen_flask_app()
+
+            # Register NoParserWithVRRoute with app
+            NoParserWithVRRoute.register_route(app)
+            # Ensure response only contains "full_name" kwarg
+            with app.test_client() as client:
+                response = client.get("/person/peter%20johnson")
+                self.assertEqual(dict(full_name="peter johnson"), response.get_json(cache=False))
+
+        def test_handle_request_with_parser_wrong_method(self):
+            """Test that if parser defined but HTTP method isn't
+            GET, POST, or PUT, route_kwargs doesn't contain any parameters
+            sent with request.
+            """
+            # Create Flask app
+            app = gen_flask_app()
+
+            # Register WithParserNoVRRoute with app
+            WithParserNoVRRoute.register_route(app)
+            # Ensure response is empty
+            with app.test_client() as client:
+                response = client.delete("/location?name=Sports%20Arena&age=5")
+                self.assertEqual(dict(), response.get_json(cache=False))
+
+        def test_handle_request_with_parser_invalid_mimetype(self):
+            """Test that if parser defined and HTTP method is POST,
+            but mimetype isn't JSON, response is 400.
+            """
+            # Create Flask app
+            app = gen_flask_app()
+
+            # Register WithParserNoVRRoute with app
+            WithParserNoVRRoute.register_route(app)
+            # Ensure response code is 400
+            with app.test_client() as client:
+                response = client.post("/location",
+                                       data="<element><child>Hello World</child></element>",
+                                       mimetype="text/xml")
+                self.assertEqual(400, response.status_code)
+
+        def test_handle_request_with_parser_invalid_argument(self):
+            """Test that if parser defined and argument invalid (parser
+            fails to parser arguments), response is 400.
+            """
+            # Create Flask app
+            app = gen_flask_app()
+
+            # Register WithParserNoVRRoute with app
+            WithParserNoVRRoute.register_route(app)
+            # Ensure response code is 400
+            with app.test_client() as client:
+                response = client.post("/location",
+                                       json=dict(name="Sports Arena", age="invalid"))
+                self.assertEqual(400, response.status_code)
+
+        def test_handle_request_with_parser_parse_arguments_error(self):
+            """Test that if parser defined and parser raises
+            ParseArgumentsError, response is 400.
+            """
+            class TypedErrorRequestParser(RequestParser):
+                def error(self, message):
+                    raise _ParseArgumentsError(message)
+
+            class TypedErrorParserRoute(WithParserNoVRRoute):
+                __slots__ = ()
+
+                ROUTE_MAP = {"/typed": {"endpoint": "search_typed", "methods": ["POST"]}}
+
+                @classmethod
+                def gen_request_parser(cls) -> Optional[RequestParser]:
+                    return (TypedErrorRequestParser()
+                            .add_argument("age", type=int, required=True))
+
+            # Create Flask app
+            app = gen_flask_app()
+
+            # Register TypedErrorParserRoute with app
+            TypedErrorParserRoute.register_route(app)
+            # Ensure response code is 400
+            with app.test_client() as client:
+                response = client.post("/typed", json=dict(age="invalid"))
+                self.assertEqual(400, response.status_code)
+
+        def test_handle_request_with_parser_merge_arguments(self):
+            """Test that if parser defined and arguments are valid, but
+            no route variable rules defined, route_kwargs only contain
+            parser arguments.
+            """
+            # Create Flask app
+            app = gen_flask_app()
+
+            # Register WithParserNoVRRoute with app
+            WithParserNoVRRoute.register_route(app)
+            # Ensure response JSON matches request
+            with app.test_client() as client:
+                response = client.post("/location",
+                                       json=dict(name="Sports Arena", age="10"))
+                self.assertEqual(dict(name="Sports Arena", age=10), response.get_json())
+
+        def test_handle_request_with_parser_direct_call(self):
+            """Test that calling handle_request directly parses arguments the
+            same as a request to the registered route.
+            """
+            # Create Flask app
+            app = gen_flask_app()
+
+            # Ensure WithParserNoVRRoute.handle_request merges parsed arguments
+            with app.test_request_context("/location", method="POST", json=dict(name="Sports Arena", age="10")):
+                self.assertEqual((dict(name="Sports Arena", age=10), 200),
+                                 WithParserNoVRRoute.handle_request())
+
+        def test_handle_request_with_parser_overridden_super(self):
+            """Test that if handle_request is overridden and calls super().handle_request,
+            parser arguments are still merged into route_kwargs.
+            """
+            class OverrideParserRoute(WithParserNoVRRoute):
+                __slots__ = ()
+
+                ROUTE_MAP = {"/override": {"endpoint": "search_override", "methods": ["POST"]}}
+
+                @classmethod
+                def handle_request(cls, **route_kwargs) -> RouteResponse:
+                    return super().handle_request(**route_kwargs)
+
+            # Create Flask app
+            app = gen_flask_app()
+
+            # Register OverrideParserRoute with app
+            OverrideParserRoute.register_route(app)
+            # Ensure response JSON matches request
+            with app.test_client() as client:
+                response = client.post("/override",
+                                       json=dict(name="Sports Arena", age="10"))
+                self.assertEqual(dict(name="Sports Arena", age=10), response.get_json())
+
+        def test_get_request_parser_cached(self):
+            """Test that parser from gen_request_parser is cached on
+            the class, and not shared with child classes.
+            """
+            # Ensure same parser returned on each call
+            parser = WithParserNoVRRoute.get_request_parser()
+            self.assertIsNotNone(parser)
+            self.assertIs(parser, WithParserNoVRRoute.get_request_parser())
+            # Ensure parent class (no parser) doesn't share cached parser
+            self.assertIsNone(NoParserNoVRRoute.get_request_parser())
+
+        def test_handle_request_with_parser_app_config(self):
+            """Test that if gen_request_parser reads app config, class
+            can be defined outside of app context and parser is generated
+            on first request.
+            """
+            class ConfigParserRoute(WithParserNoVRRoute):
+                __slots__ = ()
+
+                ROUTE_MAP = {"/config": {"endpoint": "search_config", "methods": ["POST"]}}
+
+                @classmethod
+                def gen_request_parser(cls) -> Optional[RequestParser]:
+                    return (RequestParser()
+                            .add_argument("name", default=flask.current_app.config["DEFAULT_NAME"]))
+
+            # Ensure parser wasn't generated on class creation
+            self.assertNotIn("_CACHED_PARSER", ConfigParserRoute.__dict__)
+
+            # Create Flask app
+            app = gen_flask_app()
+            app.config["DEFAULT_NAME"] = "Sports Arena"
+
+            # Register ConfigParserRoute with app
+            ConfigParserRoute.register_route(app)
+            # Ensure response JSON contains default from app config,
+            # and parser is cached after first request
+            with app.test_client() as client:
+                response = client.post("/config", json=dict())
+                self.assertEqual(dict(name="Sports Arena"), response.get_json())
+                self.assertIsNotNone(ConfigParserRoute.__dict__.get("_CACHED_PARSER"))
+                response = client.post("/config", json=dict(name="Stadium"))
+                self.assertEqual(dict(name="Stadium"), response.get_json())
+
+        def test_gen_request_parser_not_called_on_creation(self):
+            """Test that gen_request_parser isn't called when class is created,
+            so an error raised by it only affects requests to the route.
+            """
+            class EnvParserRoute(WithParserNoVRRoute):
+                __slots__ = ()
+
+                ROUTE_MAP = {"/env": {"endpoint": "search_env", "methods": ["POST"]}}
+
+                @classmethod
+                def gen_request_parser(cls) -> Optional[RequestParser]:
+                    raise KeyError("LC_FLASK_ROUTES_DEFAULT_NAME")
+
+            # Ensure parser wasn't generated on class creation
+            self.assertTrue(EnvParserRoute._HAS_PARSER)
+            self.assertNotIn("_CACHED_PARSER", EnvParserRoute.__dict__)
+
+            # Create Flask app
+            app = gen_flask_app()
+
+            # Register EnvParserRoute with app
+            EnvParserRoute.register_route(app)
+            # Ensure error is logged and HTTP 500 status code returned
+            with app.test_client() as client, self.assertLogs(logger=app.logger, level=logging.ERROR):
+                response = client.post("/env", json=dict())
+                self.assertEqual(500, response.status_code)
+
+        def test_get_request_parser_not_reusable(self):
+            """Test that if PARSER_IS_REUSABLE is False, new parser
+            is generated on each call.
+            """
+            class NotReusableParserRoute(WithParserNoVRRoute):
+                __slots__ = ()
+
+                PARSER_IS_REUSABLE = False
+
+            self.assertIsNot(NotReusableParserRoute.get_request_parser(),
+                             NotReusableParserRoute.get_request_parser())
+
+        def test_handle_request_with_parser_parse_args_dict(self):
+            """Test that if parser defines parse_args_dict, it is used
+            to parse arguments rather than parse_args.
+            """
+            class DictRequestParser(RequestParser):
+                def parse_args_dict(self):
+                    args, _ = self.parse_args()
+                    return dict(vars(args), parsed_as_dict=True)
+
+            class DictParserRoute(WithParserNoVRRoute):
+                __slots__ = ()
+
+                ROUTE_MAP = {"/dict": {"endpoint": "search_dict", "methods": ["POST"]}}
+
+                @classmethod
+                def gen_request_parser(cls) -> Optional[RequestParser]:
+                    return DictRequestParser().add_argument("name", required=True)
+
+            # Create Flask app
+            app = gen_flask_app()
+
+            # Register DictParserRoute with app
+            DictParserRoute.register_route(app)
+            # Ensure response JSON contains arguments from parse_args_dict
+            with app.test_client() as client:
+                response = client.post("/dict", json=dict(name="Sports Arena"))
+                self.assertEqual(dict(name="Sports Arena", parsed_as_dict=True), response.get_json())
+
+        def test_handle_request_with_parser_merge_arguments_vrules(self):
+            """Test that if parser defined and arguments are valid, and
+            route variable rules defined, route_kwargs contains
+            parser arguments where parsed argument(s) overwrite variable rules.
+            """
+            # Create Flask app
+            app = gen_flask_app()
+
+            # Register WithParserWithVRRoute with app
+            WithParserWithVRRoute.register_route(app)
+            # Ensure response contains "team_name" from URL parameter,
+            # not route variable rule
+            with app.test_client() as client:
+                response = client.get("/team/FC%20Barcelona?team_name=FC%20Milan")
+                self.assertEqual(dict(team_name="FC Milan", alias=None), response.get_json())